@@ -0,0 +1,78 @@
+import orjson
+import sqlite3
+import time
+from typing import Any, Dict
+
+# Returned by ResponseCache.get when nothing usable is stored
+MISSING = object()
+
+
+class ResponseCache:
+    """Persistent SQLite cache of decoded API lookups, keyed by (namespace, key).
+
+    A stored value of None records a negative lookup (e.g. a 404) so it is not
+    repeated on the next run.
+
+    Callers run on the event loop, so writes avoid fsync stalls: the database
+    uses WAL with synchronous=NORMAL and commits every `commit_every` writes
+    (and on close) rather than after each one.
+    """
+
+    def __init__(self, path: str, expire_after: float = 7 * 86400, commit_every: int = 100):
+        self.expire_after = expire_after
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self.conn.commit()
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the cached value, or MISSING if absent or expired."""
+        row = self.conn.execute(
+            "SELECT value, stored_at FROM responses WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.expire_after:
+            return MISSING
+        return orjson.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any):
+        """Store a JSON-serializable value (None for a negative lookup)."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (namespace, key, orjson.dumps(value), time.time()),
+        )
+        self._wrote(1)
+
+    def set_many(self, namespace: str, items: Dict[str, Any]):
+        """Store several values at once."""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            [(namespace, k, orjson.dumps(v), now) for k, v in items.items()],
+        )
+        self._wrote(len(items))
+
+    def _wrote(self, n: int):
+        self._uncommitted += n
+        if self._uncommitted >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        """Commit any buffered writes."""
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        """Commit buffered writes and close the database."""
+        self.commit()
+        self.conn.close()
@@ -2,273 +2,580 @@
 
 import os
 import csv
-import requests
+import logging
+import re
+import shutil
+import asyncio
+import aiohttp
+import httpx
+import orjson
 import yaml
 import urllib.parse
 import time
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Dict, List, NamedTuple, Tuple
 from pathlib import Path
 
+from .cache import MISSING, ResponseCache
+from .log import configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Resolver URL or "doi:" prefix in front of a bare 10.xxxx DOI
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:)', re.I)
+
+# OpenAlex accepts up to 50 OR-ed values in a single filter
+OPENALEX_BATCH_SIZE = 50
+
+# Largest page OpenAlex serves; one batch usually fits in a single page
+OPENALEX_PAGE_SIZE = 200
+
+# Work fields read by the scraper; everything else is trimmed server-side
+OPENALEX_SELECT = "id,doi,title,ids,best_oa_location,locations,open_access"
+
+# Resolved papers waiting for a download worker
+PIPELINE_QUEUE_SIZE = 100
+
+# Retry policy for PDF downloads (statuses, connection errors and timeouts)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 502, 503)
+
+# Per-connect and per-read limits like requests' timeout=60; no cap on the
+# whole transfer so large PDFs from slow hosts can finish
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=60)
+
+# Read size for streaming PDFs to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Chunks are handed to the I/O pool in batches of this size, one writev each
+WRITE_BATCH_SIZE = 4 << 20
+WRITE_BATCH_MAX_CHUNKS = 512  # stays under IOV_MAX (1024 on Linux)
+
+# Anything smaller is treated as an error page rather than a PDF
+MIN_PDF_SIZE = 1024
+
+# Browser-like headers for publisher downloads
+DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/pdf,application/octet-stream,*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # PDFs are already compressed; skip transfer encoding and its decode cost
+    'Accept-Encoding': 'identity',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+class _SafeFilenameTable(dict):
+    """str.translate table keeping alphanumerics, space, '-' and '_'; filled lazily per codepoint."""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        c = chr(codepoint)
+        value = codepoint if c.isalnum() or c in ' -_' else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
+def _write_batch(fd: int, chunks: List[bytes]):
+    """Write chunks with a single writev where available, finishing any short write."""
+    written = 0
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, chunks)
+        if written == sum(map(len, chunks)):
+            return
+    rest = memoryview(b"".join(chunks))[written:]
+    while rest:
+        rest = rest[os.write(fd, rest):]
+
+
+class Paper(NamedTuple):
+    """A single CSV row; field order matches the expected CSV columns."""
+    id: Optional[str]
+    pmid: str
+    title: str
+    journal: Optional[str]
+    publication_date: Optional[str]
+    authors: Optional[str]
+
 
 class CSVOpenAlexScraper:
     def __init__(self, config_path: str, csv_path: str):
         """Initialize scraper with configuration from YAML file and CSV input."""
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
-        
+
+        # Hot-path settings bound once instead of indexing config per call
+        self.outdir = self.config['outdir']
+        self.api_base = self.config['api_base']
+        self.email = self.config.get('email')
+        self.unpaywall_api = self.config['unpaywall_api']
+        self._oa_params_template = {"per-page": OPENALEX_PAGE_SIZE, "select": OPENALEX_SELECT}
+        if self.email:
+            self._oa_params_template["mailto"] = self.email
+
         self.csv_path = csv_path
-        self.session = self._make_session()
-
-    def _make_session(self) -> requests.Session:
-        """Create and configure requests session with headers."""
-        s = requests.Session()
-        s.headers.update({
-            "User-Agent": self.config['user_agent'],
-            "Referer": self.config['referer']
-        })
-        return s
-
-    def read_csv_titles(self) -> List[Dict]:
+        # HTTP clients must be created inside the running event loop
+        self.session: Optional[httpx.AsyncClient] = None
+        self.download_session: Optional[aiohttp.ClientSession] = None
+        # Dedicated pool for PDF writes so they don't queue behind DNS
+        # lookups on the loop's default executor
+        self.io_executor: Optional[ThreadPoolExecutor] = None
+        # URL -> download task, so duplicate URLs are fetched once per run
+        self._downloads: Dict[str, asyncio.Future] = {}
+        # Negative lookups are cached too; a null cache_path keeps it in memory.
+        # Opened per run in run_async and closed (flushing writes) at its end.
+        self.cache_path = self.config.get('cache_path', '.openalex_cache.sqlite') or ':memory:'
+        self.cache_expire_after = self.config.get('cache_expire_after', 7 * 86400)
+        self.cache: Optional[ResponseCache] = None
+
+    def _make_session(self) -> httpx.AsyncClient:
+        """Create the HTTP/2 client used for OpenAlex and Unpaywall API calls.
+
+        HTTP/2 multiplexes concurrent lookups over one connection per host.
+        """
+        # httpx logs every request URL, mailto/email included, at INFO; keep
+        # that out of INFO-level app logging unless the app chose a level
+        httpx_logger = logging.getLogger("httpx")
+        if httpx_logger.level == logging.NOTSET:
+            httpx_logger.setLevel(logging.WARNING)
+        return httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=30,
+            headers={
+                "User-Agent": self.config['user_agent'],
+                "Referer": self.config['referer']
+            },
+        )
+
+    def _make_download_session(self) -> aiohttp.ClientSession:
+        """Create the pooled keep-alive session shared by all PDF downloads."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=10),
+            headers=DOWNLOAD_HEADERS,
+        )
+
+    async def _get_with_retries(self, session: aiohttp.ClientSession, url: str,
+                                **kwargs) -> aiohttp.ClientResponse:
+        """GET with exponential backoff on RETRY_STATUSES, connection errors and timeouts.
+
+        The caller releases the response.
+        """
+        for attempt in range(RETRY_TOTAL + 1):
+            try:
+                r = await session.get(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == RETRY_TOTAL:
+                    raise
+            else:
+                if r.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                    return r
+                r.release()
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+    def read_csv_titles(self) -> List[Paper]:
         """Read CSV file and extract titles with metadata."""
         entries = []
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(self.csv_path, 'r', encoding='utf-8', buffering=65536, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return entries
+
+            # Short rows are padded to the header width, then every row gets a
+            # trailing None that missing columns (index -1) read from, so
+            # extra fields on long rows are never picked up
+            width = len(header)
+            idx = {c: i for i, c in enumerate(header)}
+            c_id, c_pmid, c_title, c_journal, c_date, c_authors = (
+                idx.get(name, -1) for name in Paper._fields
+            )
+            pad = [None] * width
+
             for row in reader:
-                title = row.get('title', '').strip()
+                if len(row) < width:
+                    row.extend(pad[len(row):])
+                row.append(None)
+                title = (row[c_title] or '').strip()
                 if title and title != '[]':
-                    entries.append({
-                        'id': row.get('id'),
-                        'pmid': row.get('pmid'),
-                        'title': title,
-                        'journal': row.get('journal'),
-                        'publication_date': row.get('publication_date'),
-                        'authors': row.get('authors')
-                    })
+                    entries.append(Paper(
+                        id=row[c_id],
+                        pmid=(row[c_pmid] or '').strip(),
+                        title=title,
+                        journal=row[c_journal],
+                        publication_date=row[c_date],
+                        authors=row[c_authors],
+                    ))
         return entries
 
-    def search_openalex_by_pmid(self, pmid: str) -> Optional[Dict]:
+    async def search_openalex_by_pmid(self, pmid: str) -> Optional[Dict]:
         """Retrieve the OpenAlex work for a given PMID via filter=ids.pmid."""
         if not pmid:
             return None
+        works = await self.search_openalex_batch([pmid])
+        return works.get(pmid)
+
+    async def search_openalex_batch(self, pmids: List[str]) -> Dict[str, Dict]:
+        """Retrieve OpenAlex works for many PMIDs, OR-ing up to 50 per request."""
+        pmids = list(dict.fromkeys(p for p in pmids if p))
+
+        works: Dict[str, Dict] = {}
+        misses = []
+        for pmid in pmids:
+            work = self.cache.get("openalex_pmid", pmid)
+            if work is MISSING:
+                misses.append(pmid)
+            elif work is not None:
+                works[pmid] = work
+
+        it = iter(misses)
+        chunks = []
+        while True:
+            chunk = list(islice(it, OPENALEX_BATCH_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        results = await asyncio.gather(*(self._fetch_pmid_chunk(c) for c in chunks))
+        for chunk, result in zip(chunks, results):
+            if result is None:
+                continue
+            found, complete = result
+            works.update(found)
+            # Only a complete result set proves the other PMIDs have no work
+            if complete:
+                self.cache.set_many("openalex_pmid", {pmid: found.get(pmid) for pmid in chunk})
+            else:
+                self.cache.set_many("openalex_pmid", found)
+
+        for pmid in pmids:
+            if pmid not in works:
+                logger.info(f"  → No OpenAlex record for PMID {pmid}")
+        return works
+
+    async def _fetch_pmid_chunk(self, chunk: List[str]) -> Optional[Tuple[Dict[str, Dict], bool]]:
+        """Fetch every page of a filter=ids.pmid:a|b|c query and index it by PMID.
 
-        params = {
-            "filter": f"ids.pmid:{pmid}",
-            "per-page": 1,
-        }
+        A PMID can match more than one work, so a chunk may span several pages.
+        Returns (works, complete), where complete means all meta.count results
+        arrived, or None on error.
+        """
+        params = {**self._oa_params_template, "filter": f"ids.pmid:{'|'.join(chunk)}"}
+
+        works = {}
         try:
-            r = self.session.get(self.config['api_base'], params=params, timeout=30)
-            r.raise_for_status()
-            data = r.json()
-            results = data.get("results", [])
-            if not results:
-                print(f"  → No OpenAlex record for PMID {pmid}")
-                return None
-            return results[0]
-        except requests.HTTPError as e:
-            print(f"  → HTTP {e.response.status_code} retrieving PMID {pmid}")
+            page = seen = 0
+            while True:
+                page += 1
+                r = await self.session.get(self.api_base, params={**params, "page": page})
+                r.raise_for_status()
+                data = orjson.loads(r.content)
+                results = data.get("results", [])
+                for work in results:
+                    # ids.pmid is returned as "https://pubmed.ncbi.nlm.nih.gov/<pmid>"
+                    pmid_url = (work.get("ids") or {}).get("pmid")
+                    if pmid_url:
+                        works.setdefault(pmid_url.rstrip("/").rsplit("/", 1)[-1], work)
+                seen += len(results)
+                count = (data.get("meta") or {}).get("count", 0)
+                if not results or seen >= count:
+                    return works, seen >= count
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"  → HTTP {e.response.status_code} retrieving PMIDs {chunk[0]}..{chunk[-1]}")
         except Exception as e:
-            print(f"  → Error retrieving PMID {pmid}: {e}")
+            logger.warning(f"  → Error retrieving PMIDs {chunk[0]}..{chunk[-1]}: {e}")
         return None
 
-    def extract_pdf_from_work(self, work: Dict) -> Optional[Dict]:
-        """Look through best_oa_location and all locations for the first pdf_url."""
-        best = work.get("best_oa_location") or {}
-        if best.get("pdf_url"):
-            return {
-                "pdf_url": best["pdf_url"],
-                "doi": work.get("doi"),
-                "openalex_id": work.get("id"),
-                "title": work.get("title")
-            }
-
-        for loc in work.get("locations", []):
-            if loc.get("pdf_url"):
-                return {
-                    "pdf_url": loc["pdf_url"],
-                    "doi": work.get("doi"),
-                    "openalex_id": work.get("id"),
-                    "title": work.get("title")
-                }
+    def extract_pdf_from_work(self, work: Dict) -> List[str]:
+        """List candidate download URLs from the work's own OA data, best first.
 
-        return None
+        Order: best_oa_location and every location's pdf_url, then
+        open_access.oa_url, then each location's landing_page_url. Empty and
+        repeated URLs are dropped.
+        """
+        locations = work.get("locations") or []
+        candidates = [(work.get("best_oa_location") or {}).get("pdf_url")]
+        candidates.extend(loc.get("pdf_url") for loc in locations)
+        candidates.append((work.get("open_access") or {}).get("oa_url"))
+        candidates.extend(loc.get("landing_page_url") for loc in locations)
+
+        return [url for url in dict.fromkeys(candidates) if url]
 
-    def fetch_unpaywall(self, doi: str) -> Optional[str]:
+    async def fetch_unpaywall(self, doi: str) -> Optional[str]:
         """Query Unpaywall for a public PDF URL via DOI, with proper URL‑encoding."""
-        if not doi or not self.config.get('email'):
+        if not doi or not self.email:
             return None
 
         # Clean up DOI - handle both formats: "https://doi.org/10.xxxx" and "10.xxxx"
-        if doi.startswith("https://doi.org/"):
-            doi_key = doi[16:]  # Remove "https://doi.org/" prefix
-        elif doi.startswith("http://dx.doi.org/"):
-            doi_key = doi[18:]  # Remove "http://dx.doi.org/" prefix  
-        elif doi.startswith("doi:"):
-            doi_key = doi[4:]   # Remove "doi:" prefix
-        else:
-            doi_key = doi       # Assume it's already clean
+        doi_key = _DOI_PREFIX_RE.sub('', doi, count=1)
+
+        cached = self.cache.get("unpaywall", doi_key)
+        if cached is not MISSING:
+            return cached
 
         # Don't URL-encode the DOI for Unpaywall - they expect it as-is
-        endpoint = f"{self.config['unpaywall_api']}/{doi_key}"
+        endpoint = f"{self.unpaywall_api}/{doi_key}"
 
         try:
-            resp = requests.get(endpoint,
-                                params={"email": self.config['email']},
-                                timeout=20)
-            if resp.status_code == 404:
+            resp = await self.session.get(endpoint, params={"email": self.email}, timeout=20)
+            if resp.status_code in (404, 422):
+                self.cache.set("unpaywall", doi_key, None)
                 return None
-            elif resp.status_code == 422:
-                return None
-                
+
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
             loc = data.get("best_oa_location") or {}
             url = loc.get("url_for_pdf")
             if not url:
-                print(f"  → No PDF found via Unpaywall for DOI {doi_key}")
+                logger.info(f"  → No PDF found via Unpaywall for DOI {doi_key}")
+            self.cache.set("unpaywall", doi_key, url)
             return url
 
-        except requests.HTTPError as e:
-            print(f"  → Unpaywall HTTP {e.response.status_code} for DOI {doi_key}")
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"  → Unpaywall HTTP {e.response.status_code} for DOI {doi_key}")
         except Exception as e:
-            print(f"  → Unpaywall lookup error for DOI {doi_key}: {e}")
+            logger.warning(f"  → Unpaywall lookup error for DOI {doi_key}: {e}")
 
         return None
 
-    def download_pdf(self, url: str, original_title: str, paper_id: str, subdir: str) -> Optional[str]:
+    async def download_pdf(self, url: str, original_title: str, paper_id: str, subdir: str) -> Optional[str]:
         """Download a PDF from a given URL into the specified subdir with improved headers."""
         os.makedirs(subdir, exist_ok=True)
-        safe_title = "".join(c for c in original_title if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
+        safe_title = original_title.translate(_SAFE_FILENAME_TABLE).rstrip()[:50]
         filename = f"{paper_id}_{safe_title}.pdf"
         path = os.path.join(subdir, filename)
 
         if os.path.exists(path):
-            print(f"    → Already exists: {filename}")
+            logger.info(f"    → Already exists: {filename}")
             return path
 
-        # Enhanced headers to look more like a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/pdf,application/octet-stream,*/*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
+        # Several PMIDs can resolve to the same URL; fetch it once and link
+        # the other papers' files to the result. No lock is needed since the
+        # lookup and insert happen without yielding to the event loop.
+        fetch = self._downloads.get(url)
+        if fetch is None:
+            fetch = self._downloads[url] = asyncio.ensure_future(self._fetch_pdf(url, path, filename))
+        existing = await asyncio.shield(fetch)
+        if existing is None or existing == path:
+            return existing
+
+        logger.info(f"    → Same URL as {os.path.basename(existing)}; linking")
+        try:
+            os.link(existing, path)
+        except FileExistsError:
+            pass
+        except OSError:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.io_executor, shutil.copyfile, existing, path)
+        return path
+
+    async def _fetch_pdf(self, url: str, path: str, filename: str) -> Optional[str]:
+        """Stream url to path, returning path or None if it isn't a usable PDF."""
         try:
-            # Use separate session with browser-like headers
-            with requests.Session() as session:
-                session.headers.update(headers)
-                
-                # First make a HEAD request to check if accessible
-                head_resp = session.head(url, timeout=30, allow_redirects=True)
-                if head_resp.status_code == 403:
-                    print(f"    → Publisher blocking access (403) - trying direct download anyway")
-                
-                # Try the download
-                r = session.get(url, stream=True, timeout=60, allow_redirects=True)
-                
+            async with await self._get_with_retries(self.download_session, url,
+                                                    timeout=DOWNLOAD_TIMEOUT,
+                                                    allow_redirects=True) as r:
+
                 # Check if we got HTML instead of PDF (common redirect trick)
                 content_type = r.headers.get('content-type', '').lower()
                 if 'text/html' in content_type:
-                    print(f"    → Got HTML instead of PDF (likely paywall redirect)")
+                    logger.info("    → Got HTML instead of PDF (likely paywall redirect)")
                     return None
-                    
+
                 r.raise_for_status()
-                
-                with open(path, "wb") as f:
-                    for chunk in r.iter_content(8192):
-                        f.write(chunk)
-                
-                # Verify it's actually a PDF by checking file size and first few bytes
-                if os.path.getsize(path) < 1024:  # Less than 1KB probably not a real PDF
-                    print(f"    → Downloaded file too small, likely error page")
-                    os.remove(path)
+
+                # Buffer the first KiB so both checks run before touching the disk
+                try:
+                    head = await r.content.readexactly(MIN_PDF_SIZE)
+                except asyncio.IncompleteReadError as e:
+                    head = e.partial
+                if len(head) < MIN_PDF_SIZE:
+                    logger.info("    → Downloaded file too small, likely error page")
+                    return None
+                if not head.startswith(b'%PDF'):
+                    logger.info("    → Downloaded file is not a valid PDF")
                     return None
-                    
-                # Check PDF magic bytes
-                with open(path, 'rb') as f:
-                    header = f.read(4)
-                    if not header.startswith(b'%PDF'):
-                        print(f"    → Downloaded file is not a valid PDF")
-                        os.remove(path)
-                        return None
-                
-                return path
-                
-        except requests.HTTPError as e:
-            if e.response.status_code == 403:
-                print(f"    → Publisher blocking access (403 Forbidden)")
-            elif e.response.status_code == 404:
-                print(f"    → PDF not found (404)")
+
+                # Write to a .part file so a crash never leaves a truncated PDF
+                part = path + ".part"
+                fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    await self._stream_to_fd(r, fd, head)
+                except BaseException:
+                    os.remove(part)
+                    raise
+                os.replace(part, path)
+
+            return path
+
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
+                logger.warning("    → Publisher blocking access (403 Forbidden)")
+            elif e.status == 404:
+                logger.warning("    → PDF not found (404)")
             else:
-                print(f"    → HTTP error {e.response.status_code}")
+                logger.warning(f"    → HTTP error {e.status}")
         except Exception as e:
-            print(f"    → Download error for {filename}: {e}")
+            logger.warning(f"    → Download error for {filename}: {e}")
             
         return None
 
-    def process_single_paper(self, paper: Dict) -> Optional[str]:
-        """Process a single paper: try OpenAlex then Unpaywall fallback."""
-        title = paper['title']
-        paper_id = paper.get('id') or paper['pmid']
-        pmid = paper['pmid']
+    async def _stream_to_fd(self, r: aiohttp.ClientResponse, fd: int, head: bytes):
+        """Copy the response body to fd, flushing WRITE_BATCH_SIZE at a time on the I/O pool.
+
+        Always closes fd, but never while a pool thread may still be writing to it.
+        """
+        loop = asyncio.get_running_loop()
+        pending = None
+
+        def close_when_written(fut: asyncio.Future):
+            if not fut.cancelled():
+                fut.exception()  # the awaiting task is gone; don't warn about it
+            os.close(fd)
+
+        try:
+            batch, batched = [head], len(head)
+            async for chunk in r.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                batch.append(chunk)
+                batched += len(chunk)
+                if batched >= WRITE_BATCH_SIZE or len(batch) >= WRITE_BATCH_MAX_CHUNKS:
+                    # Shielded so cancelling this task leaves the write's future
+                    # tracking the pool thread instead of marking it done early
+                    pending = loop.run_in_executor(self.io_executor, _write_batch, fd, batch)
+                    await asyncio.shield(pending)
+                    batch, batched = [], 0
+            if batch:
+                pending = loop.run_in_executor(self.io_executor, _write_batch, fd, batch)
+                await asyncio.shield(pending)
+        finally:
+            if pending is not None and not pending.done():
+                pending.add_done_callback(close_when_written)
+            else:
+                os.close(fd)
+
+    async def process_single_paper(self, paper: Paper, work: Optional[Dict]) -> Optional[str]:
+        """Process a single paper: try its OpenAlex work then Unpaywall fallback."""
+        title = paper.title
+        paper_id = paper.id or paper.pmid
+        pmid = paper.pmid
 
-        print(f"  → Searching PMID {pmid}: {title}")
-        work = self.search_openalex_by_pmid(pmid)
+        logger.info(f"  → Processing PMID {pmid}: {title}")
         if work:
-            print("    → Found in OpenAlex")
-            pdf = self.extract_pdf_from_work(work)
-            if pdf and pdf.get("pdf_url"):
-                path = self.download_pdf(pdf["pdf_url"], title, paper_id, self.config['outdir'])
+            logger.info("    → Found in OpenAlex")
+            for url in self.extract_pdf_from_work(work):
+                path = await self.download_pdf(url, title, paper_id, self.outdir)
                 if path:
-                    print(f"    → Downloaded via OpenAlex: {os.path.basename(path)}")
+                    logger.info(f"    → Downloaded via OpenAlex: {os.path.basename(path)}")
                     return path
 
-            # fallback to Unpaywall if no PDF_url in OpenAlex
-            doi = work.get("doi")
-            fallback_url = self.fetch_unpaywall(doi)
+            # OpenAlex already carries Unpaywall's data for OA works, so only
+            # ask Unpaywall directly when OpenAlex reports the work as closed
+            is_oa = (work.get("open_access") or {}).get("is_oa")
+            fallback_url = None
+            if is_oa is False:
+                fallback_url = await self.fetch_unpaywall(work.get("doi"))
             if fallback_url:
-                path = self.download_pdf(fallback_url, title, paper_id, "pdf_2")
+                path = await self.download_pdf(fallback_url, title, paper_id, "pdf_2")
                 if path:
-                    print(f"    → Downloaded via Unpaywall: {os.path.basename(path)}")
+                    logger.info(f"    → Downloaded via Unpaywall: {os.path.basename(path)}")
                     return path
         else:
-            print(f"    → No OpenAlex record; skipping Unpaywall")
+            logger.info("    → No OpenAlex record; skipping Unpaywall")
 
-        print("    → No PDF available")
+        logger.info("    → No PDF available")
         return None
 
     def run(self, max_papers: Optional[int] = None, start_from: int = 0):
         """Execute the CSV scraping process."""
+        configure_logging()
+        asyncio.run(self.run_async(max_papers=max_papers, start_from=start_from))
+
+    async def run_async(self, max_papers: Optional[int] = None, start_from: int = 0):
+        """Process all papers as a two-stage pipeline.
+
+        Metadata workers resolve PMID batches against OpenAlex and feed a
+        bounded queue that download workers drain, so lookups for later
+        papers overlap with downloads for earlier ones.
+        """
         papers = self.read_csv_titles()
         if start_from > 0:
             papers = papers[start_from:]
         if max_papers:
             papers = papers[:max_papers]
 
-        print(f"Processing {len(papers)} papers")
-        found = downloaded = failed = 0
+        logger.info(f"Processing {len(papers)} papers")
+        workers = self.config.get('workers', 10)
+        metadata_workers = self.config.get('metadata_workers', 5)
+        paths: List[Optional[str]] = [None] * len(papers)
 
-        for i, paper in enumerate(papers, 1):
-            print(f"[{i}/{len(papers)}]")
-            path = self.process_single_paper(paper)
-            if path:
-                downloaded += 1
-            else:
-                failed += 1
-            found += 1
+        numbered = list(enumerate(papers, 1))
+        chunk_q: asyncio.Queue = asyncio.Queue()
+        for start in range(0, len(numbered), OPENALEX_BATCH_SIZE):
+            chunk_q.put_nowait(numbered[start:start + OPENALEX_BATCH_SIZE])
+        meta_q: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+        async def metadata_worker():
+            while not chunk_q.empty():
+                chunk = chunk_q.get_nowait()
+                works = await self.search_openalex_batch([p.pmid for _, p in chunk])
+                for i, paper in chunk:
+                    await meta_q.put((i, paper, works.get(paper.pmid)))
 
-        print("\nSummary:")
-        print(f"  Papers processed:        {found}")
-        print(f"  Successfully downloaded: {downloaded}")
-        print(f"  Failed to find/download:{failed}")
+        async def download_worker():
+            while True:
+                i, paper, work = await meta_q.get()
+                try:
+                    logger.info(f"[{i}/{len(papers)}]")
+                    paths[i - 1] = await self.process_single_paper(paper, work)
+                except Exception as e:
+                    logger.warning(f"    → Error processing PMID {paper.pmid}: {e}")
+                finally:
+                    meta_q.task_done()
+
+        async with self._make_session() as session, \
+                self._make_download_session() as download_session:
+            self.session = session
+            self.download_session = download_session
+            self.io_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-io")
+            self._downloads = {}
+            self.cache = ResponseCache(self.cache_path, expire_after=self.cache_expire_after)
+            downloaders = [asyncio.create_task(download_worker()) for _ in range(workers)]
+            try:
+                await asyncio.gather(*(metadata_worker() for _ in range(metadata_workers)))
+                await meta_q.join()
+            finally:
+                for task in downloaders:
+                    task.cancel()
+                await asyncio.gather(*downloaders, return_exceptions=True)
+                self.session = None
+                self.download_session = None
+                self.io_executor.shutdown(wait=True)
+                self.io_executor = None
+                self.cache.close()
+                self.cache = None
+
+        found = len(paths)
+        downloaded = sum(1 for p in paths if p)
+        failed = found - downloaded
+
+        logger.info("\nSummary:")
+        logger.info(f"  Papers processed:        {found}")
+        logger.info(f"  Successfully downloaded: {downloaded}")
+        logger.info(f"  Failed to find/download:{failed}")
 
 
 if __name__ == "__main__":
     import argparse
 
+    # Under `python -m` __name__ is "__main__"; keep records under the package logger
+    logger = logging.getLogger("openalex_scraper.csv_scraper")
+
     parser = argparse.ArgumentParser(description="CSV → OpenAlex PDF scraper")
     parser.add_argument("config", help="Path to YAML config")
     parser.add_argument("csv", help="Path to CSV input")
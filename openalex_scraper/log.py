@@ -0,0 +1,29 @@
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+def configure_logging(level: int = logging.INFO):
+    """Route log records through a queue to a background stdout writer.
+
+    Workers only enqueue records, so concurrent downloads never contend for
+    the stdout lock. Only the package's own loggers are configured, so other
+    libraries' INFO records stay hidden. Does nothing if the application has
+    already set up logging on the root or package logger.
+    """
+    package = logging.getLogger("openalex_scraper")
+    if logging.getLogger().handlers or package.handlers:
+        return
+
+    q: queue.Queue = queue.Queue(-1)
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(q, stream)
+    listener.start()
+    atexit.register(listener.stop)
+
+    package.addHandler(QueueHandler(q))
+    package.setLevel(level)
+    package.propagate = False
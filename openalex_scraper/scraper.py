@@ -1,16 +1,34 @@
+import logging
 import os
+import orjson
 import requests
 from concurrent.futures import ThreadPoolExecutor
 import yaml
 from typing import Optional, Dict, List
 
+from .log import configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Work fields read by the scraper; everything else is trimmed server-side
+OPENALEX_SELECT = "id,doi,title,best_oa_location,locations,open_access"
+
 
 class OpenAlexScraper:
     def __init__(self, config_path: str):
         """Initialize scraper with configuration from YAML file."""
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
-        
+
+        # Hot-path settings bound once instead of indexing config per call
+        self.outdir = self.config['outdir']
+        self.api_base = self.config['api_base']
+        self.email = self.config.get('email')
+        self.unpaywall_api = self.config['unpaywall_api']
+        self._oa_params_template = {"select": OPENALEX_SELECT}
+        if self.email:
+            self._oa_params_template["mailto"] = self.email
+
         self.session = self._make_session()
 
     def _make_session(self) -> requests.Session:
@@ -22,8 +40,11 @@ class OpenAlexScraper:
         })
         return s
 
-    def fetch_works(self, page: int) -> dict:
-        """Query OpenAlex /works with filters and return JSON."""
+    def fetch_works(self, cursor: str = "*") -> dict:
+        """Query one cursor page of OpenAlex /works with filters and return JSON.
+
+        The next page's cursor is in meta.next_cursor (None after the last page).
+        """
         filters = ["is_oa:true"]
         if self.config['min_citations'] is not None:
             citation_threshold = self.config['min_citations'] - 1
@@ -31,14 +52,15 @@ class OpenAlexScraper:
         filter_str = ",".join(filters)
 
         params = {
+            **self._oa_params_template,
             "filter": filter_str,
             "search": self.config['topic'],
             "per-page": self.config['per_page'],
-            "page": page,
+            "cursor": cursor,
         }
-        r = self.session.get(self.config['api_base'], params=params, timeout=30)
+        r = self.session.get(self.api_base, params=params, timeout=30)
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     def extract_entries(self, works_json: dict) -> List[dict]:
         """Extract PDF URLs and metadata from works JSON."""
@@ -57,21 +79,21 @@ class OpenAlexScraper:
 
     def fetch_unpaywall(self, doi: str) -> Optional[str]:
         """Query Unpaywall for a public PDF URL via DOI."""
-        if not doi or not self.config['email']:
+        if not doi or not self.email:
             return None
-        url = f"{self.config['unpaywall_api']}/{doi}"
-        r = requests.get(url, params={"email": self.config['email']}, timeout=20)
+        url = f"{self.unpaywall_api}/{doi}"
+        r = requests.get(url, params={"email": self.email}, timeout=20)
         if r.status_code != 200:
             return None
-        data = r.json()
+        data = orjson.loads(r.content)
         loc = data.get("best_oa_location") or {}
         return loc.get("url_for_pdf")
 
     def download_pdf(self, entry: Dict) -> str:
         """Download PDF from entry URL with Unpaywall fallback."""
-        os.makedirs(self.config['outdir'], exist_ok=True)
+        os.makedirs(self.outdir, exist_ok=True)
         name = entry["pdf_url"].split("/")[-1].split("?")[0]
-        path = os.path.join(self.config['outdir'], name)
+        path = os.path.join(self.outdir, name)
         if os.path.exists(path):
             return path
 
@@ -82,7 +104,7 @@ class OpenAlexScraper:
             if e.response.status_code in (403, 429):
                 fallback = self.fetch_unpaywall(entry.get("doi"))
                 if fallback:
-                    print(f"→ Publisher blocked. Retrying via Unpaywall: {fallback}")
+                    logger.info(f"→ Publisher blocked. Retrying via Unpaywall: {fallback}")
                     r = self.session.get(fallback, stream=True, timeout=60)
                     r.raise_for_status()
                 else:
@@ -97,15 +119,20 @@ class OpenAlexScraper:
 
     def run(self):
         """Execute the scraping process."""
+        configure_logging()
         entries = []
 
-        for pg in range(1, self.config['pages'] + 1):
-            js = self.fetch_works(pg)
+        cursor = "*"
+        pg = 0
+        while cursor and pg < self.config['pages']:
+            pg += 1
+            js = self.fetch_works(cursor)
             es = self.extract_entries(js)
-            print(f"[Page {pg}] Found {len(es)} PDF entries")
+            logger.info(f"[Page {pg}] Found {len(es)} PDF entries")
             entries.extend(es)
+            cursor = js.get("meta", {}).get("next_cursor")
 
-        print(f"Total PDF entries: {len(entries)}")
+        logger.info(f"Total PDF entries: {len(entries)}")
 
         with ThreadPoolExecutor(max_workers=self.config['workers']) as ex:
             futures = [
@@ -115,6 +142,6 @@ class OpenAlexScraper:
             for f in futures:
                 try:
                     path = f.result()
-                    print(f"Downloaded → {path}")
+                    logger.info(f"Downloaded → {path}")
                 except Exception as err:
-                    print(f"Failed → {err}") 
\ No newline at end of file
+                    logger.warning(f"Failed → {err}") 
\ No newline at end of file